@@ -42,6 +42,15 @@ eofs_package_available = eofs_spec is not None
 if eofs_package_available:
     import eofs.standard as eofs_package
 
+numba_spec = importlib.util.find_spec("numba")
+numba_package_available = numba_spec is not None
+if numba_package_available:
+    import numba
+
+# the DOYs are the same for every call, so compute them only once
+_DOY_LIST = tuple(tools.doy_list())
+_NDOYS = len(_DOY_LIST)
+
 
 def angle_between_eofs(reference: eof.EOFData, target=eof.EOFData):
     """
@@ -71,6 +80,19 @@ def angle_btwn_vectors(vector1, vector2):
                              /(np.linalg.norm(vector1)*np.linalg.norm(vector2)),-1.,1.))
 
 
+def angle_btwn_unit_vectors(vector1, vector2):
+    """
+    Calculates the angle between vectors of length 1, theta = 2*arcsin(||t - r|| / 2)
+
+    Compared to :meth:`angle_btwn_vectors`, this saves the calculation of the norms and is
+    more accurate for small angles, where arccos is ill-conditioned.
+
+    Returns angle in radians
+    """
+
+    return 2*np.arcsin(np.clip(0.5*np.linalg.norm(vector1 - vector2), 0., 1.))
+
+
 ################### EOF Calculation with rotation
 
 def calc_eofs_from_olr_with_rotation(olrdata: olr.OLRData, implementation: str = "internal", sign_doy1reference: bool = True,
@@ -129,10 +151,13 @@ def post_process_rotation(eofdata: eof.EOFDataForAllDOYs, sign_doy1reference: bo
     :return: the postprocessed series of EOFs
     """
     pp_eofs = omi.correct_spontaneous_sign_changes_in_eof_series(eofdata, doy1reference=sign_doy1reference)
-    rot_eofs = rotate_eofs(pp_eofs)
-    norm_eofs = normalize_eofs(rot_eofs)
+
+    # stack the EOFs only once for rotation and normalization and convert back at the very end
+    E = _stack_eofs(pp_eofs)
+    E_rot = _to_double_precision(_rotate(E), pp_eofs)
+    E_norm = _normalize(E_rot)
     
-    return norm_eofs
+    return _unstack_eofs(E_norm, pp_eofs)
 
 
 def rotate_eofs(orig_eofs: eof.EOFDataForAllDOYs) -> eof.EOFDataForAllDOYs:
@@ -145,18 +170,209 @@ def rotate_eofs(orig_eofs: eof.EOFDataForAllDOYs) -> eof.EOFDataForAllDOYs:
     :return: set of rotated EOFs
     """
 
-    delta = calculate_angle_from_discontinuity(orig_eofs)
+    E_rot = _to_double_precision(_rotate(_stack_eofs(orig_eofs)), orig_eofs)
+
+    return _unstack_eofs(E_rot, orig_eofs)
+
+
+def _rotate(E: np.ndarray) -> np.ndarray:
+    """
+    Array version of :meth:`rotate_eofs`.
+
+    :param E: The stacked EOFs, see :meth:`_stack_eofs`.
+
+    :return: The stacked rotated EOFs.
+    """
+
+    # the angle calculation and the rotation share the Gram matrices
+    G = _gram_matrices(E)
+
+    delta = _angle_from_discontinuity(E, G)
 
     print('Rotating by ', delta)
 
-    return rotate_each_eof_by_delta(orig_eofs, delta)
+    return _rotate_by_delta(E, G, delta)
 
 
 def rotation_matrix(delta):
     """
     Return 2d rotation matrix for corresponding delta
     """
-    return np.array([[np.cos(delta), -np.sin(delta)],[np.sin(delta), np.cos(delta)]])
+    c, s = np.cos(delta), np.sin(delta)
+
+    R = np.empty((2, 2))
+    R[0, 0] = c
+    R[0, 1] = -s
+    R[1, 0] = s
+    R[1, 1] = c
+
+    return R
+
+
+def _stack_eofs(eofdata: eof.EOFDataForAllDOYs, dtype=np.float32) -> np.ndarray:
+    """
+    Stacks the EOF pairs of all DOYs into a single array, so that the rotation algorithm can operate
+    on array slices instead of individual :class:`EOFData` objects.
+
+    The EOFs are stored in single precision by default, which halves the memory traffic of the
+    rotation. The resulting differences to double precision (< 1e-5) are well below the noise, which
+    is removed by the rotation. The rotated EOFs are converted back with :meth:`_to_double_precision`
+    before any further processing.
+
+    :param eofdata: The EOF series to stack.
+    :param dtype: The data type of the stacked array.
+
+    :return: Array of shape (number of DOYs, 2, number of grid points). Index [i, 0] contains EOF1 and
+    index [i, 1] contains EOF2 of DOY i+1.
+    """
+
+    doy1 = eofdata.eofdata_for_doy(1)
+
+    E = np.empty((_NDOYS, 2, doy1.eof1vector.size), dtype=dtype)
+    for i, d in enumerate(_DOY_LIST):
+        doyn = eofdata.eofdata_for_doy(d)
+        E[i, 0] = doyn.eof1vector
+        E[i, 1] = doyn.eof2vector
+
+    return E
+
+
+def _to_double_precision(E_rot: np.ndarray, orig_eofs: eof.EOFDataForAllDOYs) -> np.ndarray:
+    """
+    Converts stacked rotated EOFs back to double precision. The first DOY is not changed by the
+    rotation, so it is taken exactly from the original EOFs instead of the single precision array.
+
+    :param E_rot: The stacked rotated EOFs.
+    :param orig_eofs: The EOF series, which has been rotated.
+
+    :return: The stacked rotated EOFs in double precision.
+    """
+
+    E_rot = E_rot.astype(np.float64)
+
+    doy1 = orig_eofs.eofdata_for_doy(1)
+    E_rot[0, 0] = doy1.eof1vector
+    E_rot[0, 1] = doy1.eof2vector
+
+    return E_rot
+
+
+def _eof_metadata(eofdata: eof.EOFDataForAllDOYs) -> Tuple:
+    """
+    Collects the data besides the EOF vectors from an EOF series in a single pass.
+
+    :param eofdata: The EOF series.
+
+    :return: A tuple of the latitude grid, the longitude grid (both are the same for all DOYs), and
+    lists of the explained variances, eigenvalues and numbers of observations of each DOY.
+    """
+
+    doys = [eofdata.eofdata_for_doy(d) for d in _DOY_LIST]
+    explained_variances = [doyn.explained_variances for doyn in doys]
+    eigenvalues = [doyn.eigenvalues for doyn in doys]
+    no_observations = [doyn.no_observations for doyn in doys]
+
+    return doys[0].lat, doys[0].long, explained_variances, eigenvalues, no_observations
+
+
+def _unstack_eofs(E: np.ndarray, template: eof.EOFDataForAllDOYs) -> eof.EOFDataForAllDOYs:
+    """
+    Inverse of :meth:`_stack_eofs`: builds a new EOF series from a stacked EOF array. All other
+    data (grid, explained variances, eigenvalues, number of observations) is taken from the template.
+    The EOFs are returned in double precision.
+
+    :param E: Array of shape (number of DOYs, 2, number of grid points).
+    :param template: The EOF series that provides the remaining data for each DOY.
+
+    :return: The new EOF series.
+    """
+
+    lat, long, explained_variances, eigenvalues, no_observations = _eof_metadata(template)
+    E = E.astype(np.float64, copy=False)
+
+    eofdata_new = [eof.EOFData(lat, long, E[i, 0], E[i, 1],
+                               explained_variances=explained_variances[i],
+                               eigenvalues=eigenvalues[i],
+                               no_observations=no_observations[i])
+                   for i in range(_NDOYS)]
+
+    return eof.EOFDataForAllDOYs(eofdata_new)
+
+
+def _fold_grams(G: np.ndarray) -> np.ndarray:
+    """
+    Computes the product G[-1] @ ... @ G[1] @ G[0] of a series of 2x2 matrices.
+
+    Written as an explicit scalar loop, so that it is compiled by numba, if available.
+
+    :param G: Array of shape (number of matrices, 2, 2).
+
+    :return: The 2x2 product.
+    """
+
+    c00, c01, c10, c11 = 1., 0., 0., 1.
+    for n in range(G.shape[0]):
+        g00, g01, g10, g11 = G[n, 0, 0], G[n, 0, 1], G[n, 1, 0], G[n, 1, 1]
+        c00, c01, c10, c11 = (g00*c00 + g01*c10, g00*c01 + g01*c11,
+                              g10*c00 + g11*c10, g10*c01 + g11*c11)
+
+    C = np.empty((2, 2))
+    C[0, 0] = c00
+    C[0, 1] = c01
+    C[1, 0] = c10
+    C[1, 1] = c11
+
+    return C
+
+
+if numba_package_available:
+    _fold_grams = numba.njit(cache=True)(_fold_grams)
+
+
+def _gram_matrices(E: np.ndarray) -> np.ndarray:
+    """
+    Computes the 2x2 matrices G[n] = B_{n+1}.T @ B_n for all DOYs, where B_n is the (number of grid points x 2)
+    matrix of the EOFs of DOY n+1. For the last DOY, B_{n+1} is the matrix of January 1.
+
+    The projected EOFs always lie in the EOF space of the current day, so they can be tracked by a 2x2
+    coefficient matrix C with rots = B_n @ C instead of the full vectors. Projecting from DOY n onto
+    DOY n+1 then multiplies C by G[n].
+
+    :param E: The stacked EOFs, see :meth:`_stack_eofs`.
+
+    :return: Array of shape (number of DOYs, 2, 2).
+    """
+
+    # the small 2x2 matrices are accumulated in double precision
+    G = np.empty((E.shape[0], 2, 2))
+    np.einsum('nid,njd->nij', E[1:], E[:-1], out=G[:-1])
+    # for last day in cycle, return to January 1
+    np.einsum('id,jd->ij', E[0], E[-1], out=G[-1])
+
+    return G
+
+
+def _angle_from_discontinuity(E: np.ndarray, G: np.ndarray) -> float:
+    """
+    Array version of :meth:`calculate_angle_from_discontinuity`.
+
+    :param E: The stacked EOFs, see :meth:`_stack_eofs`.
+    :param G: The Gram matrices of E, see :meth:`_gram_matrices`.
+
+    :return: See :meth:`calculate_angle_from_discontinuity`.
+    """
+
+    # project onto previous day for the complete cycle, starting at DOY1: C = G[-1] @ ... @ G[0]
+    C = _fold_grams(G)
+
+    # only EOF1 of B_0 @ C is needed, which is built directly from the rows of E
+    rot_eof1 = C[0, 0]*E[0, 0] + C[1, 0]*E[0, 1]
+    
+    # calculate discontinuity between Jan 1 and Jan 1 at end of rotation cycle
+    discont = angle_btwn_unit_vectors(E[0, 0] / np.linalg.norm(E[0, 0]),
+                                      rot_eof1 / np.linalg.norm(rot_eof1))
+
+    return -discont/_NDOYS
 
 
 def calculate_angle_from_discontinuity(orig_eofs: eof.EOFDataForAllDOYs):
@@ -171,30 +387,98 @@ def calculate_angle_from_discontinuity(orig_eofs: eof.EOFDataForAllDOYs):
     first and last day of year, divided by the length of the year.
     """
 
-    list_of_doys = tools.doy_list()
-    doy1 = orig_eofs.eofdata_for_doy(1)
+    E = _stack_eofs(orig_eofs)
 
-    ndoys = len(list_of_doys)
-    
-    # set DOY1 initialization
-    rots = np.array([doy1.eof1vector, doy1.eof2vector])
-
-    # project onto previous day
-    for d in list_of_doys:
-        if d+1 > ndoys: # for last day in cycle, return to January 1
-            doyn = orig_eofs.eofdata_for_doy(1)
-        else:
-            doyn = orig_eofs.eofdata_for_doy(d+1)
-
-        B = np.array([doyn.eof1vector, doyn.eof2vector]).T 
-        A = np.array([rots[0,:], rots[1,:]]).T
-    
-        rots = np.matmul(np.matmul(B, B.T),A).T
-    
-    # calculate discontinuity between Jan 1 and Jan 1 at end of rotation cycle
-    discont = tools.angle_btwn_vectors(doy1.eof1vector, rots[0,:])
+    return _angle_from_discontinuity(E, _gram_matrices(E))
+
+
+def _propagate_coefficients(G: np.ndarray, R: np.ndarray) -> np.ndarray:
+    """
+    Computes the coefficient matrices C[n] = G[n-1] @ C[n-1] @ R with C[0] = I for all DOYs.
+
+    Written as an explicit scalar loop, so that it is compiled by numba, if available.
+
+    :param G: Array of shape (number of DOYs - 1, 2, 2) with the matrices B_n.T @ B_{n-1}.
+    :param R: The 2x2 rotation matrix.
+
+    :return: Array of shape (number of DOYs, 2, 2) with the coefficient matrices.
+    """
+
+    ndoys = G.shape[0] + 1
+    C = np.empty((ndoys, 2, 2))
+    C[0, 0, 0] = 1.
+    C[0, 0, 1] = 0.
+    C[0, 1, 0] = 0.
+    C[0, 1, 1] = 1.
+
+    r00, r01, r10, r11 = R[0, 0], R[0, 1], R[1, 0], R[1, 1]
+    for n in range(1, ndoys):
+        # T = G[n-1] @ C[n-1]
+        t00 = G[n-1, 0, 0]*C[n-1, 0, 0] + G[n-1, 0, 1]*C[n-1, 1, 0]
+        t01 = G[n-1, 0, 0]*C[n-1, 0, 1] + G[n-1, 0, 1]*C[n-1, 1, 1]
+        t10 = G[n-1, 1, 0]*C[n-1, 0, 0] + G[n-1, 1, 1]*C[n-1, 1, 0]
+        t11 = G[n-1, 1, 0]*C[n-1, 0, 1] + G[n-1, 1, 1]*C[n-1, 1, 1]
+        # C[n] = T @ R
+        C[n, 0, 0] = t00*r00 + t01*r10
+        C[n, 0, 1] = t00*r01 + t01*r11
+        C[n, 1, 0] = t10*r00 + t11*r10
+        C[n, 1, 1] = t10*r01 + t11*r11
 
-    return -discont/ndoys
+    return C
+
+
+if numba_package_available:
+    _propagate_coefficients = numba.njit(cache=True)(_propagate_coefficients)
+
+
+def _apply_coefficients(E: np.ndarray, C: np.ndarray) -> np.ndarray:
+    """
+    Builds the EOFs B_n @ C[n] for all DOYs.
+
+    :param E: The stacked EOFs, see :meth:`_stack_eofs`.
+    :param C: Array of shape (number of DOYs, 2, 2) with the coefficient matrices, same data type as E.
+
+    :return: The stacked new EOFs.
+    """
+
+    return np.einsum('nid,nij->njd', E, C)
+
+
+if numba_package_available:
+    @numba.njit(parallel=True, cache=True)
+    def _apply_coefficients(E, C):
+        # the DOYs are independent, so they are distributed over all available threads
+        out = np.empty_like(E)
+        for n in numba.prange(E.shape[0]):
+            c00, c01, c10, c11 = C[n, 0, 0], C[n, 0, 1], C[n, 1, 0], C[n, 1, 1]
+            for d in range(E.shape[2]):
+                e1 = E[n, 0, d]
+                e2 = E[n, 1, d]
+                out[n, 0, d] = e1*c00 + e2*c10
+                out[n, 1, d] = e1*c01 + e2*c11
+        return out
+
+
+def _rotate_by_delta(E: np.ndarray, G: np.ndarray, delta: float) -> np.ndarray:
+    """
+    Array version of :meth:`rotate_each_eof_by_delta`.
+
+    :param E: The stacked EOFs, see :meth:`_stack_eofs`.
+    :param G: The Gram matrices of E, see :meth:`_gram_matrices`.
+    :param delta: scalar by which to rotate EOFs calculated from discontinuity
+
+    :return: The stacked rotated EOFs.
+    """
+
+    R = rotation_matrix(delta)
+
+    # the rotated EOFs of DOY n are tracked by the 2x2 coefficient matrix C[n] with rots = B_n @ C[n].
+    # project onto previous day and rotate, first doy is unchanged. The last Gram matrix, which
+    # returns to January 1, is not needed here.
+    C = _propagate_coefficients(G[:-1], R)
+
+    # build the rotated EOFs for all DOYs at once
+    return _apply_coefficients(E, C.astype(E.dtype))
 
 
 def rotate_each_eof_by_delta(orig_eofs: eof.EOFDataForAllDOYs, 
@@ -210,34 +494,10 @@ def rotate_each_eof_by_delta(orig_eofs: eof.EOFDataForAllDOYs,
     :returns: new EOFdata with rotated EOFs.  
     """
 
-    R = rotation_matrix(delta)
+    E = _stack_eofs(orig_eofs)
+    E_rot = _to_double_precision(_rotate_by_delta(E, _gram_matrices(E), delta), orig_eofs)
 
-    doy1 = orig_eofs.eofdata_for_doy(1)
-    list_of_doys = tools.doy_list()
-    eofdata_rotated = []
-    eofdata_rotated.append(doy1) # first doy is unchanged
-
-    # set DOY1 initialization
-    rots = np.array([doy1.eof1vector, doy1.eof2vector])
-
-    # project onto previous day and rotate 
-    for d in list_of_doys[1:]:
-        doyn = orig_eofs.eofdata_for_doy(d)
-
-        B = np.array([doyn.eof1vector, doyn.eof2vector]).T 
-        A = np.array([rots[0,:], rots[1,:]]).T
-    
-        rots = np.matmul(np.matmul(np.matmul(B, B.T),A),R).T
-
-        # create new EOFData variable for rotated EOFs
-        eofdata_rotated.append(eof.EOFData(doyn.lat, doyn.long, 
-                                np.squeeze(rots[0,:]), 
-                                np.squeeze(rots[1,:]),
-                                explained_variances=doyn.explained_variances,
-                                eigenvalues=doyn.eigenvalues,
-                                no_observations=doyn.no_observations))
-
-    return eof.EOFDataForAllDOYs(eofdata_rotated)
+    return _unstack_eofs(E_rot, orig_eofs)
 
 
 def normalize_eofs(orig_eofs: eof.EOFDataForAllDOYs) -> eof.EOFDataForAllDOYs:
@@ -246,22 +506,23 @@ def normalize_eofs(orig_eofs: eof.EOFDataForAllDOYs) -> eof.EOFDataForAllDOYs:
 
     :return: normalize the EOFs to have length 1
     """
-    list_of_doys = tools.doy_list()
 
-    eofdata_normalized = []
+    E = _normalize(_stack_eofs(orig_eofs, dtype=np.float64))
+
+    return _unstack_eofs(E, orig_eofs)
 
-    for d in list_of_doys:
 
-        doyn = orig_eofs.eofdata_for_doy(d)
-        eof1_norm = doyn.eof1vector/np.linalg.norm(doyn.eof1vector)
-        eof2_norm = doyn.eof2vector/np.linalg.norm(doyn.eof2vector) 
+def _normalize(E: np.ndarray) -> np.ndarray:
+    """
+    Array version of :meth:`normalize_eofs`. Normalizes in place.
+
+    :param E: The stacked EOFs, see :meth:`_stack_eofs`.
+
+    :return: The normalized stacked EOFs.
+    """
 
-       # create new EOFData variable for rotated EOFs
-        eofdata_normalized.append(eof.EOFData(doyn.lat, doyn.long, 
-                                            np.squeeze(eof1_norm), 
-                                            np.squeeze(eof2_norm),
-                                            explained_variances=doyn.explained_variances,
-                                            eigenvalues=doyn.eigenvalues,
-                                            no_observations=doyn.no_observations)) 
+    # norms of all EOFs at once, shape (ndoys, 2)
+    norms = np.sqrt(np.einsum('ijd,ijd->ij', E, E))
+    E /= norms[..., np.newaxis]
 
-    return eof.EOFDataForAllDOYs(eofdata_normalized) 
+    return E
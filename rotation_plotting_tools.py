@@ -21,19 +21,14 @@ def organize_pc_dataframe(pc_path) -> pd.DataFrame:
     pcs = pd.read_csv(pc_path, sep=',', header=0)
 
     # calculate the amplitde for each day (RMS of PC1 and PC2)
-    pcs['Amplitude'] = np.sqrt(pcs.PC1**2 + pcs.PC2**2)
+    pcs['Amplitude'] = np.hypot(pcs.PC1.values, pcs.PC2.values)
 
     # expand date into YR, MM, DD variables
-    yy = [None]*len(pcs.Date)
-    mm = [None]*len(pcs.Date)
-    dd = [None]*len(pcs.Date)
+    dates = pd.to_datetime(pcs.Date, format='%Y-%m-%d')
 
-    for i in range(len(pcs.Date)):
-        yy[i],mm[i],dd[i] = map(int, pcs.Date[i].split('-'))
-
-    pcs['Year'] = yy
-    pcs['Month'] = mm
-    pcs['Day'] = dd
+    pcs['Year'] = dates.dt.year.astype('int64')
+    pcs['Month'] = dates.dt.month.astype('int64')
+    pcs['Day'] = dates.dt.day.astype('int64')
 
     return pcs
 
@@ -47,18 +42,16 @@ def calc_mean_eof(eofdata, start_doy, end_doy):
     """
     
     doy1 = eofdata.eofdata_for_doy(1)
-    eof_map_grid = np.empty([doy1.eof1map.shape[0], doy1.eof1map.shape[1], 2, end_doy-start_doy])
-    
-    doy_range = [d for d in range(start_doy, end_doy)]
+    eof_map_grid = np.empty([end_doy-start_doy, doy1.eof1map.shape[0], doy1.eof1map.shape[1], 2])
     
-    # select EOFs within DOY range
-    for i, d in enumerate(doy_range):
+    # select EOFs within DOY range, DOYs along the first axis
+    for i, d in enumerate(range(start_doy, end_doy)):
         
         doyn = eofdata.eofdata_for_doy(d)
-        eof_map_grid[:,:,0,i] = doyn.eof1map
-        eof_map_grid[:,:,1,i] = doyn.eof2map
+        eof_map_grid[i, ..., 0] = doyn.eof1map
+        eof_map_grid[i, ..., 1] = doyn.eof2map
         
     # calculate average
-    eof_map_avg = np.mean(eof_map_grid, axis=3)
+    eof_map_avg = np.mean(eof_map_grid, axis=0)
     
     return eof_map_avg
\ No newline at end of file